@@ -1,6 +1,21 @@
 # SPDX-FileCopyrightText: 2026-present Comet11x
 # SPDX-License-Identifier: MIT
 
+from pyfplib.aggregators import (
+    Aggregates,
+    Aggregator,
+    count,
+    distinct,
+    folding,
+    histogram,
+    max_of,
+    mean,
+    min_of,
+    quantile,
+    sum_of,
+    variance,
+)
+from pyfplib.arrays import OptionArray, ResultArray
 from pyfplib.either import Either, Left, Right
 from pyfplib.functools import all_of, any_of, find, fold, for_each, head, is_empty, is_not_empty, last, none_of, tail
 from pyfplib.iterator import Iter
@@ -8,6 +23,8 @@ from pyfplib.option import Nothing, Option, Some
 from pyfplib.result import Err, Ok, Result
 
 __all__ = (  # noqa: PLE0604
+    Aggregates.__name__,
+    Aggregator.__name__,
     Either.__name__,
     Err.__name__,
     Iter.__name__,
@@ -15,7 +32,9 @@ __all__ = (  # noqa: PLE0604
     Nothing.__name__,
     Ok.__name__,
     Option.__name__,
+    OptionArray.__name__,
     Result.__name__,
+    ResultArray.__name__,
     Right.__name__,
     Some.__name__,
     all_of.__name__,
@@ -29,4 +48,14 @@ __all__ = (  # noqa: PLE0604
     last.__name__,
     is_empty.__name__,
     is_not_empty.__name__,
+    count.__name__,
+    distinct.__name__,
+    folding.__name__,
+    histogram.__name__,
+    max_of.__name__,
+    mean.__name__,
+    min_of.__name__,
+    quantile.__name__,
+    sum_of.__name__,
+    variance.__name__,
 )
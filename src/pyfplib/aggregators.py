@@ -0,0 +1,355 @@
+"""This module provides mergeable aggregators used by Iter.aggregate.
+
+Each Aggregator describes a reduction by four functions: init creates an empty
+state, step adds an item to a state, merge combines two states and finish turns
+a state into a result. Because states are mergeable, partial results computed
+over chunks or by different workers can be combined with Aggregates.merge.
+
+Usage:
+    Iter(data).aggregate(count=count(), total=folding(add, 0), avg=mean())
+"""
+
+import math
+from copy import deepcopy
+from hashlib import blake2b
+from numbers import Number
+from typing import Any, Callable, Dict, Generic, Hashable, Iterable, List, Optional, Tuple, TypeVar
+
+from pyfplib.option import Nothing, Option, Some
+
+S = TypeVar("S")
+R = TypeVar("R")
+
+_EMPTY = object()
+
+_MIN_PRECISION = 4
+_MAX_PRECISION = 16
+
+_MIN_CAPACITY = 2
+
+
+def _identity(state: Any) -> Any:
+    return state
+
+
+class Aggregator(Generic[S, R]):
+    """
+    Describes a streaming reduction with a mergeable state.
+
+    Usage:
+        Aggregator(init=lambda: 0, step=lambda acc, _: acc + 1, merge=lambda a, b: a + b)
+    """
+
+    def __init__(
+        self,
+        init: Callable[[], S],
+        step: Callable[[S, Any], S],
+        merge: Callable[[S, S], S],
+        finish: Callable[[S], R] = _identity,
+    ):
+        """
+        Args:
+            init: creates an empty state
+            step: returns a state updated with the given item
+            merge: returns a state combining the two given states
+            finish: converts a state into a result
+        """
+        self.init = init
+        self.step = step
+        self.merge = merge
+        self.finish = finish
+
+
+class Aggregates:
+    """
+    Runs many named aggregators in a single pass.
+
+    Usage:
+        aggs = Aggregates(count=count(), avg=mean())
+        states = aggs.merge(aggs.update(aggs.init(), chunk1), aggs.update(aggs.init(), chunk2))
+        aggs.finish(states)  # {"count": ..., "avg": ...}
+    """
+
+    def __init__(self, **aggregators: Aggregator):
+        self.__names = list(aggregators)
+        self.__aggregators = list(aggregators.values())
+
+    def init(self) -> Dict[str, Any]:
+        """Returns empty states of all aggregators."""
+        return {name: agg.init() for name, agg in zip(self.__names, self.__aggregators)}
+
+    def update(self, states: Dict[str, Any], iterable: Iterable[Any]) -> Dict[str, Any]:
+        """Returns the given states updated with all items of the iterable in one pass."""
+        acc = [states[name] for name in self.__names]
+        steps = list(enumerate(agg.step for agg in self.__aggregators))
+        for item in iterable:
+            for idx, step in steps:
+                acc[idx] = step(acc[idx], item)
+        return dict(zip(self.__names, acc))
+
+    def merge(self, *states: Dict[str, Any]) -> Dict[str, Any]:
+        """Combines partial states, e.g. computed over chunks or by workers."""
+        ret = self.init()
+        for other in states:
+            ret = {name: agg.merge(ret[name], other[name]) for name, agg in zip(self.__names, self.__aggregators)}
+        return ret
+
+    def finish(self, states: Dict[str, Any]) -> Dict[str, Any]:
+        """Converts states into results."""
+        return {name: agg.finish(states[name]) for name, agg in zip(self.__names, self.__aggregators)}
+
+    def run(self, iterable: Iterable[Any]) -> Dict[str, Any]:
+        """Returns results of all aggregators computed in one pass over the iterable."""
+        return self.finish(self.update(self.init(), iterable))
+
+
+def count() -> Aggregator[int, int]:
+    """Counts items."""
+    return Aggregator(lambda: 0, lambda acc, _: acc + 1, lambda a, b: a + b)
+
+
+def folding(
+    callback: Callable[[Any, Any], Any],
+    first: Any,
+    merge: Optional[Callable[[Any, Any], Any]] = None,
+) -> Aggregator:
+    """
+    Folds items with the given callback starting from first.
+
+    Args:
+        callback: combines an accumulator with an item
+        first: an initial accumulator, each state gets its own deep copy
+        merge: combines two accumulators, defaults to callback
+            which is correct when callback is associative and first is its identity
+    """
+    return Aggregator(lambda: deepcopy(first), callback, callback if merge is None else merge)
+
+
+def sum_of(key: Callable[[Any], Any] = _identity) -> Aggregator:
+    """Sums items or keys of items."""
+    return Aggregator(lambda: 0, lambda acc, item: acc + key(item), lambda a, b: a + b)
+
+
+def _pick(better: Callable[[Any, Any], bool]) -> Callable[[Any, Any], Any]:
+    def pick(acc: Any, item: Any) -> Any:
+        return item if acc is _EMPTY or (item is not _EMPTY and better(item, acc)) else acc
+
+    return pick
+
+
+def _to_option(state: Any) -> Option[Any]:
+    return Nothing() if state is _EMPTY else Some(state)
+
+
+def min_of() -> Aggregator[Any, Option[Any]]:
+    """Finds the minimal item, returns Nothing for no items."""
+    pick = _pick(lambda item, acc: item < acc)
+    return Aggregator(lambda: _EMPTY, pick, pick, _to_option)
+
+
+def max_of() -> Aggregator[Any, Option[Any]]:
+    """Finds the maximal item, returns Nothing for no items."""
+    pick = _pick(lambda item, acc: item > acc)
+    return Aggregator(lambda: _EMPTY, pick, pick, _to_option)
+
+
+def histogram(key: Callable[[Any], Hashable] = _identity) -> Aggregator[Dict[Hashable, int], Dict[Hashable, int]]:
+    """
+    Counts items per bucket.
+
+    Args:
+        key: maps an item to its bucket
+    """
+
+    def step(acc: Dict[Hashable, int], item: Any) -> Dict[Hashable, int]:
+        bucket = key(item)
+        acc[bucket] = acc.get(bucket, 0) + 1
+        return acc
+
+    def merge(a: Dict[Hashable, int], b: Dict[Hashable, int]) -> Dict[Hashable, int]:
+        ret = dict(a)
+        for bucket, number in b.items():
+            ret[bucket] = ret.get(bucket, 0) + number
+        return ret
+
+    return Aggregator(dict, step, merge)
+
+
+# Welford's online algorithm, the state is (count, mean, sum of squared deviations).
+_Moments = Tuple[int, float, float]
+
+
+def _moments_step(acc: _Moments, item: float) -> _Moments:
+    n, mu, m2 = acc
+    n += 1
+    delta = item - mu
+    mu += delta / n
+    return n, mu, m2 + delta * (item - mu)
+
+
+def _moments_merge(a: _Moments, b: _Moments) -> _Moments:
+    na, mua, m2a = a
+    nb, mub, m2b = b
+    n = na + nb
+    if n == 0:
+        return a
+    delta = mub - mua
+    return n, mua + delta * nb / n, m2a + m2b + delta * delta * na * nb / n
+
+
+def mean() -> Aggregator[_Moments, Option[float]]:
+    """Computes the arithmetic mean, returns Nothing for no items."""
+    return Aggregator(
+        lambda: (0, 0.0, 0.0),
+        _moments_step,
+        _moments_merge,
+        lambda acc: Some(acc[1]) if acc[0] else Nothing(),
+    )
+
+
+def variance(ddof: int = 0) -> Aggregator[_Moments, Option[float]]:
+    """
+    Computes the variance, returns Nothing if there are not more than ddof items.
+
+    Args:
+        ddof: delta degrees of freedom, 0 for population and 1 for sample variance
+    """
+    return Aggregator(
+        lambda: (0, 0.0, 0.0),
+        _moments_step,
+        _moments_merge,
+        lambda acc: Some(acc[2] / (acc[0] - ddof)) if acc[0] > ddof else Nothing(),
+    )
+
+
+def _is_integral(number: Number) -> bool:
+    try:
+        return number == int(number)  # type: ignore[call-overload]
+    except (TypeError, ValueError, OverflowError):
+        return False
+
+
+def _stable_hash(item: Any) -> int:
+    """\
+    Returns a 64-bit hash which does not depend on the process, unlike hash().
+    The type is hashed along with the value, but equal numbers such as 1, 1.0 and True get the same hash.
+    """
+    if isinstance(item, complex) and not item.imag:
+        item = item.real
+    if isinstance(item, bytes):
+        data = b"bytes:" + item
+    elif isinstance(item, str):
+        data = b"str:" + item.encode()
+    elif isinstance(item, Number) and _is_integral(item):
+        data = f"int:{int(item)}".encode()  # type: ignore[call-overload]
+    elif isinstance(item, Number):
+        # hash() of numbers is not randomized and it is equal for equal numbers of different types
+        data = f"number:{hash(item)}".encode()
+    else:
+        data = f"{type(item).__qualname__}:{item!r}".encode()
+    return int.from_bytes(blake2b(data, digest_size=8).digest(), "little")
+
+
+def distinct(precision: int = 12) -> Aggregator[bytearray, int]:
+    """
+    Estimates a number of distinct items with HyperLogLog.
+    Items are hashed by their type and str/bytes value, number or repr,
+    so states of different processes can be merged.
+
+    Args:
+        precision: uses 2 ** precision registers, the relative error is about 1.04 / sqrt(2 ** precision)
+    """
+    if not _MIN_PRECISION <= precision <= _MAX_PRECISION:
+        msg = f"precision must be in range [{_MIN_PRECISION}, {_MAX_PRECISION}]"
+        raise ValueError(msg)
+    registers = 1 << precision
+    width = 64 - precision
+
+    def step(acc: bytearray, item: Any) -> bytearray:
+        hashed = _stable_hash(item)
+        idx = hashed >> width
+        rank = width - (hashed & ((1 << width) - 1)).bit_length() + 1
+        acc[idx] = max(acc[idx], rank)
+        return acc
+
+    def merge(a: bytearray, b: bytearray) -> bytearray:
+        return bytearray(map(max, a, b))
+
+    def finish(acc: bytearray) -> int:
+        alpha = 0.7213 / (1 + 1.079 / registers)
+        estimate = alpha * registers * registers / math.fsum(2.0**-rank for rank in acc)
+        zeros = acc.count(0)
+        if estimate <= 2.5 * registers and zeros:
+            estimate = registers * math.log(registers / zeros)
+        return round(estimate)
+
+    return Aggregator(lambda: bytearray(registers), step, merge, finish)
+
+
+# Items of each level and numbers of compactions of each level.
+_Sketch = Tuple[List[List[Any]], List[int]]
+
+
+def quantile(q: float, capacity: int = 256) -> Aggregator[_Sketch, Option[Any]]:
+    """
+    Estimates the q-quantile with a compacting sketch (a simplified KLL sketch).
+    Each level keeps at most capacity items, items of level h have weight 2 ** h.
+    A compaction promotes every other item of an even number of sorted items, so the total weight
+    is preserved. Odd or even items are kept in turn, the turn of each level starts with its height,
+    so the result is deterministic. The last added item of an odd-length level stays at that level.
+
+    Args:
+        q: the quantile in range [0, 1]
+        capacity: a size of each level, at least 2, bigger capacity gives smaller error
+    """
+    if not 0 <= q <= 1:
+        msg = "q must be in range [0, 1]"
+        raise ValueError(msg)
+    if capacity < _MIN_CAPACITY:
+        msg = f"capacity must be at least {_MIN_CAPACITY}"
+        raise ValueError(msg)
+
+    def compact(acc: _Sketch) -> _Sketch:
+        levels, compactions = acc
+        height = 0
+        while height < len(levels):
+            if len(levels[height]) >= capacity:
+                if height + 1 == len(levels):
+                    levels.append([])
+                    compactions.append(0)
+                # the last added item of an odd-length level is left at the level
+                odd = len(levels[height]) % 2
+                items = sorted(levels[height][: len(levels[height]) - odd])
+                levels[height + 1].extend(items[(compactions[height] + height) & 1 :: 2])
+                levels[height] = levels[height][len(items) :]
+                compactions[height] += 1
+            height += 1
+        return acc
+
+    def step(acc: _Sketch, item: Any) -> _Sketch:
+        acc[0][0].append(item)
+        return compact(acc) if len(acc[0][0]) >= capacity else acc
+
+    def merge(a: _Sketch, b: _Sketch) -> _Sketch:
+        height = max(len(a[0]), len(b[0]))
+        levels: List[List[Any]] = [[] for _ in range(height)]
+        compactions = [0] * height
+        for levels_of, compactions_of in (a, b):
+            for idx, items in enumerate(levels_of):
+                levels[idx].extend(items)
+                compactions[idx] += compactions_of[idx]
+        return compact((levels, compactions))
+
+    def finish(acc: _Sketch) -> Option[Any]:
+        weighted = sorted((item, 1 << height) for height, items in enumerate(acc[0]) for item in items)
+        if not weighted:
+            return Nothing()
+        rank = q * sum(weight for _, weight in weighted)
+        total = 0
+        for item, weight in weighted:
+            total += weight
+            if total >= rank:
+                return Some(item)
+        return Some(weighted[-1][0])
+
+    return Aggregator(lambda: ([[]], [0]), step, merge, finish)
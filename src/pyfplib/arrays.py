@@ -0,0 +1,376 @@
+"""This module provides columnar containers OptionArray[T] and ResultArray[T, E].
+
+Values are kept in a list or array.array next to a validity bitmap
+(bit i is set when the element i is Some[T] / Ok[T, E]), so holding millions
+of optional values does not cost a Python object per element.
+"""
+
+from array import array
+from itertools import chain, compress, islice
+from typing import Any, Callable, Generic, Iterable, Iterator, List, Optional, Sequence, TypeVar, Union
+
+from pyfplib.iterator import Iter
+from pyfplib.option import Nothing, Option, Some
+from pyfplib.result import Err, Ok, Result
+
+T = TypeVar("T")
+E = TypeVar("E")
+U = TypeVar("U")
+
+Column = Union[List[Any], "array[Any]"]
+
+_BITS_PER_BYTE = 8
+
+# Default typecode of map, it keeps the typecode of the source array.
+_SAME_TYPECODE: Any = object()
+
+_BYTE_BITS = [tuple(bool((byte >> bit) & 1) for bit in range(_BITS_PER_BYTE)) for byte in range(256)]
+
+
+def _make_bitmap(bits: Iterable[bool]) -> bytearray:
+    """Packs the given booleans into a LSB-first validity bitmap."""
+    bitmap = bytearray()
+    byte = 0
+    bit = 0
+    for flag in bits:
+        if flag:
+            byte |= 1 << bit
+        bit += 1
+        if bit == _BITS_PER_BYTE:
+            bitmap.append(byte)
+            byte = 0
+            bit = 0
+    if bit:
+        bitmap.append(byte)
+    return bitmap
+
+
+def _bits(bitmap: Sequence[int], length: int) -> Iterator[bool]:
+    """Unpacks the given validity bitmap into `length` booleans."""
+    return islice(chain.from_iterable(map(_BYTE_BITS.__getitem__, bitmap)), length)
+
+
+def _is_set(bitmap: Sequence[int], index: int) -> bool:
+    return bool(bitmap[index >> 3] & (1 << (index & 7)))
+
+
+def _count(bitmap: Sequence[int]) -> int:
+    return bin(int.from_bytes(bytes(bitmap), "little")).count("1")
+
+
+def _column(values: Iterable[Any], typecode: Optional[str]) -> Column:
+    return list(values) if typecode is None else array(typecode, values)
+
+
+def _null(typecode: Optional[str]) -> Any:
+    """Returns a placeholder stored in empty slots of a column."""
+    return None if typecode is None else 0
+
+
+def _ok_column(values: Iterable[Any], typecode: Optional[str]) -> Column:
+    """Returns a column of Ok values, Ok(None) cannot be stored in a typed column."""
+    if typecode is None:
+        return list(values)
+    values = list(values)
+    if any(value is None for value in values):
+        msg = f"Ok(None) cannot be stored in a column with typecode {typecode!r}, use typecode=None"
+        raise ValueError(msg)
+    return array(typecode, values)
+
+
+def _normalize_index(index: int, length: int) -> int:
+    if index < 0:
+        index += length
+    if not 0 <= index < length:
+        msg = "index out of range"
+        raise IndexError(msg)
+    return index
+
+
+class OptionArray(Generic[T]):
+    """
+    Columnar container of Option[T] values.
+
+    Usage:
+        OptionArray.from_options([Some(1), Nothing(), Some(3)])
+        OptionArray.from_optional([1.5, None, 2.5], typecode="d")
+    """
+
+    def __init__(self, values: Column, validity: bytearray, typecode: Optional[str] = None):
+        """
+        Internal constructor - use from_options or from_optional instead.
+
+        Args:
+            values: column of contained values, empty slots hold a placeholder
+            validity: LSB-first bitmap, bit i is set when values[i] is Some
+            typecode: array.array typecode of the values column or None for list
+        """
+        self.__values = values
+        self.__validity = validity
+        self.__typecode = typecode
+
+    @property
+    def values(self) -> Column:
+        """Returns the raw values column (empty slots hold a placeholder)."""
+        return self.__values
+
+    @property
+    def validity(self) -> bytearray:
+        """Returns the validity bitmap."""
+        return self.__validity
+
+    @property
+    def typecode(self) -> Optional[str]:
+        """Returns the typecode of the values column or None if it is a list."""
+        return self.__typecode
+
+    def __len__(self) -> int:
+        return len(self.__values)
+
+    def __getitem__(self, index: int) -> Option[T]:
+        index = _normalize_index(index, len(self))
+        return Some(self.__values[index]) if _is_set(self.__validity, index) else Nothing()
+
+    def __iter__(self) -> Iterator[Option[T]]:
+        for value, valid in zip(self.__values, self.__bits()):
+            yield Some(value) if valid else Nothing()
+
+    def __eq__(self, other: object) -> bool:
+        ret: bool = False
+        if isinstance(other, OptionArray):
+            ret = list(self) == list(other)
+        return ret
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        items = ", ".join(repr(value) if valid else "None" for value, valid in zip(self.__values, self.__bits()))
+        return f"OptionArray([{items}])"
+
+    def __bits(self) -> Iterator[bool]:
+        return _bits(self.__validity, len(self.__values))
+
+    def is_some(self, index: int) -> bool:
+        """Returns True if the element at the given index is Some[T]."""
+        return _is_set(self.__validity, _normalize_index(index, len(self)))
+
+    def count_some(self) -> int:
+        """Returns a number of Some[T] elements."""
+        return _count(self.__validity)
+
+    def count_none(self) -> int:
+        """Returns a number of Nothing elements."""
+        return len(self) - self.count_some()
+
+    def map(self, fn: Callable[[T], U], typecode: Optional[str] = _SAME_TYPECODE) -> "OptionArray[U]":
+        """
+        Maps contained values T -> U, empty slots stay empty.
+        As in Option.map, a None returned by fn makes the slot empty.
+
+        Args:
+            fn: a pure function mapping T to U
+            typecode: array.array typecode of the new values column or None for list,
+                defaults to the typecode of this array
+        """
+        if typecode is _SAME_TYPECODE:
+            typecode = self.__typecode
+        null = _null(typecode)
+        mapped = [fn(value) if valid else None for value, valid in zip(self.__values, self.__bits())]
+        validity = _make_bitmap(value is not None for value in mapped)
+        values = _column((null if value is None else value for value in mapped), typecode)
+        return OptionArray(values, validity, typecode)
+
+    def unwrap_or(self, default: T) -> Column:
+        """Returns a column of contained values, empty slots are replaced with the given default."""
+        return _column(
+            (value if valid else default for value, valid in zip(self.__values, self.__bits())),
+            self.__typecode,
+        )
+
+    def fill(self, value: T) -> "OptionArray[T]":
+        """Returns a new OptionArray where empty slots contain the given value."""
+        values = self.unwrap_or(value)
+        return OptionArray(values, _make_bitmap(True for _ in range(len(values))), self.__typecode)
+
+    def filter_some(self) -> Column:
+        """Returns a column of contained values skipping empty slots."""
+        return _column(compress(self.__values, self.__bits()), self.__typecode)
+
+    def iter(self) -> Iter[Option[T]]:
+        """Returns Iter over Option[T] elements."""
+        return Iter(list(self))
+
+    @staticmethod
+    def from_options(options: Iterable[Option[T]], typecode: Optional[str] = None) -> "OptionArray[T]":
+        """Creates OptionArray[T] from Option[T] values."""
+        return OptionArray.from_optional((option.value for option in options), typecode)
+
+    @staticmethod
+    def from_optional(values: Iterable[Optional[T]], typecode: Optional[str] = None) -> "OptionArray[T]":
+        """Creates OptionArray[T] from Optional[T] values, None is treated as Nothing."""
+        values = list(values)
+        null = _null(typecode)
+        validity = _make_bitmap(value is not None for value in values)
+        column = _column((null if value is None else value for value in values), typecode)
+        return OptionArray(column, validity, typecode)
+
+
+class ResultArray(Generic[T, E]):
+    """
+    Columnar container of Result[T, E] values.
+    Ok values and errors are kept in two columns next to a validity bitmap.
+
+    Usage:
+        ResultArray.from_results([Ok(1), Err("bad input"), Ok(3)])
+    """
+
+    def __init__(self, values: Column, errors: List[Any], validity: bytearray, typecode: Optional[str] = None):
+        """
+        Internal constructor - use from_results instead.
+
+        Args:
+            values: column of Ok values, Err slots hold a placeholder
+            errors: column of errors, Ok slots hold None
+            validity: LSB-first bitmap, bit i is set when the element i is Ok
+            typecode: array.array typecode of the values column or None for list
+        """
+        self.__values = values
+        self.__errors = errors
+        self.__validity = validity
+        self.__typecode = typecode
+
+    @property
+    def values(self) -> Column:
+        """Returns the raw values column (Err slots hold a placeholder)."""
+        return self.__values
+
+    @property
+    def errors(self) -> List[Any]:
+        """Returns the raw errors column (Ok slots hold None)."""
+        return self.__errors
+
+    @property
+    def validity(self) -> bytearray:
+        """Returns the validity bitmap."""
+        return self.__validity
+
+    @property
+    def typecode(self) -> Optional[str]:
+        """Returns the typecode of the values column or None if it is a list."""
+        return self.__typecode
+
+    def __len__(self) -> int:
+        return len(self.__values)
+
+    def __getitem__(self, index: int) -> Result[T, E]:
+        index = _normalize_index(index, len(self))
+        return Ok(self.__values[index]) if _is_set(self.__validity, index) else Err(self.__errors[index])
+
+    def __iter__(self) -> Iterator[Result[T, E]]:
+        for value, error, valid in zip(self.__values, self.__errors, self.__bits()):
+            yield Ok(value) if valid else Err(error)
+
+    def __repr__(self) -> str:
+        items = ", ".join(
+            f"Ok({value!r})" if valid else f"Err({error!r})"
+            for value, error, valid in zip(self.__values, self.__errors, self.__bits())
+        )
+        return f"ResultArray([{items}])"
+
+    def __eq__(self, other: object) -> bool:
+        ret: bool = False
+        if isinstance(other, ResultArray):
+            ret = len(self) == len(other) and all(
+                left.is_ok() == right.is_ok() and left.value == right.value for left, right in zip(self, other)
+            )
+        return ret
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __bits(self) -> Iterator[bool]:
+        return _bits(self.__validity, len(self.__values))
+
+    def is_ok(self, index: int) -> bool:
+        """Returns True if the element at the given index is Ok[T, E]."""
+        return _is_set(self.__validity, _normalize_index(index, len(self)))
+
+    def count_ok(self) -> int:
+        """Returns a number of Ok[T, E] elements."""
+        return _count(self.__validity)
+
+    def count_err(self) -> int:
+        """Returns a number of Err[T, E] elements."""
+        return len(self) - self.count_ok()
+
+    def map(self, fn: Callable[[T], U], typecode: Optional[str] = _SAME_TYPECODE) -> "ResultArray[U, E]":
+        """
+        Maps Ok values T -> U, errors are kept as is.
+
+        Args:
+            fn: a pure function mapping T to U
+            typecode: array.array typecode of the new values column or None for list,
+                defaults to the typecode of this array
+
+        Raises:
+            ValueError: When fn returns None and the new values column is typed
+        """
+        if typecode is _SAME_TYPECODE:
+            typecode = self.__typecode
+        null = _null(typecode)
+        values = _ok_column(
+            (fn(value) if valid else null for value, valid in zip(self.__values, self.__bits())), typecode
+        )
+        return ResultArray(values, list(self.__errors), bytearray(self.__validity), typecode)
+
+    def map_err(self, fn: Callable[[E], U]) -> "ResultArray[T, U]":
+        """Maps errors E -> U, Ok values are kept as is."""
+        errors = [None if valid else fn(error) for error, valid in zip(self.__errors, self.__bits())]
+        return ResultArray(_column(self.__values, self.__typecode), errors, bytearray(self.__validity), self.__typecode)
+
+    def unwrap_or(self, default: T) -> Column:
+        """Returns a column of Ok values, Err slots are replaced with the given default."""
+        return _column(
+            (value if valid else default for value, valid in zip(self.__values, self.__bits())),
+            self.__typecode,
+        )
+
+    def fill(self, value: T) -> "ResultArray[T, E]":
+        """Returns a new ResultArray where Err slots are replaced with Ok of the given value."""
+        values = self.unwrap_or(value)
+        validity = _make_bitmap(True for _ in range(len(values)))
+        return ResultArray(values, [None] * len(values), validity, self.__typecode)
+
+    def filter_ok(self) -> Column:
+        """Returns a column of Ok values skipping Err slots."""
+        return _column(compress(self.__values, self.__bits()), self.__typecode)
+
+    def filter_err(self) -> List[E]:
+        """Returns a list of errors skipping Ok slots."""
+        return [error for error, valid in zip(self.__errors, self.__bits()) if not valid]
+
+    def ok(self) -> OptionArray[T]:
+        """Returns OptionArray[T] of Ok values, Err slots become Nothing."""
+        return OptionArray(_column(self.__values, self.__typecode), bytearray(self.__validity), self.__typecode)
+
+    def err(self) -> OptionArray[E]:
+        """Returns OptionArray[E] of errors, Ok slots become Nothing."""
+        return OptionArray(list(self.__errors), _make_bitmap(not valid for valid in self.__bits()))
+
+    def iter(self) -> Iter[Result[T, E]]:
+        """Returns Iter over Result[T, E] elements."""
+        return Iter(list(self))
+
+    @staticmethod
+    def from_results(results: Iterable[Result[T, E]], typecode: Optional[str] = None) -> "ResultArray[T, E]":
+        """
+        Creates ResultArray[T, E] from Result[T, E] values.
+
+        Raises:
+            ValueError: When the values column is typed and there is Ok(None)
+        """
+        results = list(results)
+        null = _null(typecode)
+        validity = _make_bitmap(result.is_ok() for result in results)
+        values = _ok_column((result.value if result.is_ok() else null for result in results), typecode)
+        errors = [None if result.is_ok() else result.value for result in results]
+        return ResultArray(values, errors, validity, typecode)
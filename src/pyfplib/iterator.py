@@ -1,11 +1,58 @@
-from typing import Any, Callable, Generic, Iterable, List, TypeVar
+from typing import Any, Callable, Dict, Generic, Iterable, List, Optional, Tuple, TypeVar
 
+from pyfplib.aggregators import Aggregates, Aggregator
 from pyfplib.functools import find, fold, for_each
 from pyfplib.option import Nothing, Option, Some
 from pyfplib.result import Result
 
 T = TypeVar("T")
 
+SizeHint = Tuple[int, Optional[int]]
+
+
+def _size_hint_of(iterable: Iterable[Any]) -> SizeHint:
+    """Returns an exact (n, n) size hint for sized iterables, otherwise (0, None)."""
+    try:
+        size = len(iterable)  # type: ignore[arg-type]
+    except TypeError:
+        return 0, None
+    return size, size
+
+
+def _skip_hint(number: int) -> Callable[[SizeHint], SizeHint]:
+    def hint(size: SizeHint) -> SizeHint:
+        lower, upper = size
+        if number >= 0:
+            return max(lower - number, 0), None if upper is None else max(upper - number, 0)
+        return min(lower, -number), -number if upper is None else min(upper, -number)
+
+    return hint
+
+
+def _step_by_hint(step: int) -> Callable[[SizeHint], SizeHint]:
+    def hint(size: SizeHint) -> SizeHint:
+        lower, upper = size
+        if step > 0:
+            return -(-lower // step), None if upper is None else -(-upper // step)
+        return 0, upper
+
+    return hint
+
+
+def _zip_hint(iterable: Iterable[Any]) -> Callable[[SizeHint], SizeHint]:
+    def hint(size: SizeHint) -> SizeHint:
+        lower, upper = size
+        other_lower, other_upper = _size_hint_of(iterable)
+        if other_upper is None:
+            return 0, upper
+        return min(lower, other_lower), other_upper if upper is None else min(upper, other_upper)
+
+    return hint
+
+
+def _unknown_lower_hint(size: SizeHint) -> SizeHint:
+    return 0, size[1]
+
 
 class Iter(Generic[T]):
     """ """
@@ -17,6 +64,7 @@ class Iter(Generic[T]):
         self.__prepared: Option[Iterable[T]] = Nothing()
         self.__pipeline: List[Callable[[Any], Any]] = []
         self.__index = 0
+        self.__hints: List[Callable[[SizeHint], SizeHint]] = []
 
     @property
     def __target(self) -> Iterable[Any]:
@@ -30,6 +78,7 @@ class Iter(Generic[T]):
                 acc = fn(acc)
             self.__prepared = Some(acc)
             self.__pipeline = []
+            self.__hints = []
 
         return self.__target
 
@@ -50,6 +99,7 @@ class Iter(Generic[T]):
         return Iter(out)
 
     def skip(self, number: int) -> Self:
+        self.__hints.append(_skip_hint(number))
         self.__pipeline.append(lambda itr: itr[number:])
         return self
 
@@ -58,10 +108,12 @@ class Iter(Generic[T]):
             o = find(lambda pair: (callback(pair[1]) and Nothing()) or Some(pair[0]), enumerate(itr))
             return o.map(lambda idx: itr[idx]).unwrap_or([])
 
+        self.__hints.append(_unknown_lower_hint)
         self.__pipeline.append(skip)
         return self
 
     def step_by(self, step: int) -> Self:
+        self.__hints.append(_step_by_hint(step))
         self.__pipeline.append(lambda itr: itr[::step])
         return self
 
@@ -69,16 +121,29 @@ class Iter(Generic[T]):
         return Result.try_call(lambda itr, idx: itr[idx], self.__apply(), index).ok()
 
     def zip(self, iterable: Iterable[Any]) -> Self:
+        self.__hints.append(_zip_hint(iterable))
         self.__pipeline.append(lambda itr: list(zip(itr, iterable)))
         return self
 
     def filter(self, callback: Callable[[T], bool]) -> Self:
+        self.__hints.append(_unknown_lower_hint)
         self.__pipeline.append(lambda itr: list(filter(callback, itr)))
         return self
 
     def fold(self, first: Any, callback: Callable[[Any, T], Any]) -> Any:
         return fold(callback, self.__apply(), first)
 
+    def aggregate(self, **aggregators: Aggregator) -> Dict[str, Any]:
+        """\
+        Computes many named reductions in a single pass.
+
+        Usage:
+            from pyfplib import count, folding, mean
+
+            Iter(data).aggregate(count=count(), total=folding(add, 0), avg=mean())
+        """
+        return Aggregates(**aggregators).run(self.__apply())
+
     def for_each(self, callback: Callable[[Any], None]):
         """"""
         for_each(callback, self.__apply())
@@ -99,8 +164,20 @@ class Iter(Generic[T]):
         """"""
         return ctor(self.__apply())
 
+    def size_hint(self) -> SizeHint:
+        """\
+        Returns the (lower, upper) bounds on the number of remaining elements
+        without running the pipeline. The upper bound is None if it is unknown.
+        """
+        return fold(lambda size, hint: hint(size), self.__hints, _size_hint_of(self.__target))
+
     def __len__(self) -> int:
-        return len(self.__target)
+        if len(self.__pipeline) == 0:
+            return len(self.__target)
+        lower, upper = self.size_hint()
+        if lower == upper:
+            return lower
+        return len(self.__apply())
 
     def len(self) -> int:
         return len(self)
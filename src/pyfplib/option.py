@@ -2,7 +2,7 @@
 and two constructors of Option: Ok[T] and Err[T].
 """
 
-from typing import Callable, Generic, Optional, TypeVar, cast
+from typing import Any, Callable, Generic, Optional, TypeVar, cast
 
 from pyfplib.errors import ExpectedError, UnwrapError
 
@@ -112,6 +112,22 @@ class Option(Generic[T]):
         """
         return fn(self.__value) if self.__value is not None else Nothing()
 
+    def chain(self, *fns: Callable[[T], "Option[U]"]) -> "Option[U]":
+        """
+        Applies the given functions one by one to the contained value in a single loop
+        and stops at the first Nothing.
+        Like map_from, it calls any callable returning Option.
+
+        Args:
+            fns: functions returning Option
+        """
+        ret: Option[Any] = self
+        for fn in fns:
+            if ret.value is None:
+                return Nothing()
+            ret = fn(ret.value)
+        return ret
+
     def __eq__(self, other: object) -> bool:
         """Equality comparison based on contained values."""
         ret: bool = False
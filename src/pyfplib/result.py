@@ -5,7 +5,7 @@ __copyright__ = "Copyright 2026, Comet11x"
 __license__ = "MIT"
 __version__ = "0.1.0"
 
-from typing import Callable, Generic, Optional, TypeVar, Union
+from typing import Any, Callable, Generic, Optional, TypeVar, Union
 
 from pyfplib.errors import ExpectedError, UnwrapError
 from pyfplib.option import Nothing, Option, Some
@@ -140,7 +140,11 @@ class Result(Generic[T, E]):
         return Err(fn(self.__value)) if self.is_err() else self
 
     def flatten(self) -> Self:
-        return self.__value.flatten() if isinstance(self.__value, Result) else self
+        """Removes all levels of nesting, Ok(Ok(Ok(value))) becomes Ok(value)."""
+        ret = self
+        while isinstance(ret.value, Result):
+            ret = ret.value
+        return ret
 
     def __and__(self, other: Union[Self, Callable[[T], Self]]) -> Self:
         return other if self.is_ok() else self
@@ -148,6 +152,20 @@ class Result(Generic[T, E]):
     def and_then(self, fn: Callable[[T], Self]) -> Self:
         return fn(self.__value) if self.is_ok() and isinstance(fn, Result.__Fn) else self
 
+    def chain(self, *fns: Callable[[Any], "Result[Any, E]"]) -> "Result[Any, E]":
+        """\
+        Applies the given functions one by one to a contained Ok value in a single loop
+        and stops at the first Err[T, E].
+        Unlike and_then, it calls any callable returning Result,
+        including classes, bound methods and functools.partial objects.
+        """
+        ret: Result[Any, E] = self
+        for fn in fns:
+            if ret.is_err():
+                break
+            ret = fn(ret.value)
+        return ret
+
     def __or__(self, other: Union[Self, Callable[[T], Self]]) -> Self:
         return other if self.is_err() else self
 
@@ -0,0 +1,122 @@
+""""""
+
+import statistics
+from operator import add
+
+import pytest
+
+from pyfplib import (
+    Aggregates,
+    Iter,
+    Nothing,
+    Some,
+    count,
+    distinct,
+    folding,
+    histogram,
+    max_of,
+    mean,
+    min_of,
+    quantile,
+    variance,
+)
+
+DATA = [statistics.NormalDist(10, 3).inv_cdf((idx * 7919 % 10_007 + 1) / 10_009) for idx in range(10_000)]
+
+
+def test_aggregate():
+    """Test many reductions are computed in one pass"""
+    ret = Iter(DATA).aggregate(
+        count=count(),
+        total=folding(add, 0),
+        low=min_of(),
+        high=max_of(),
+        avg=mean(),
+        var=variance(ddof=1),
+        signs=histogram(lambda x: x > 10),
+    )
+    assert ret["count"] == len(DATA)
+    assert ret["total"] == pytest.approx(sum(DATA))
+    assert ret["low"] == Some(min(DATA))
+    assert ret["high"] == Some(max(DATA))
+    assert ret["avg"].unwrap() == pytest.approx(statistics.mean(DATA))
+    assert ret["var"].unwrap() == pytest.approx(statistics.variance(DATA))
+    assert sum(ret["signs"].values()) == len(DATA)
+
+
+def test_aggregate_empty():
+    """Test aggregators return Nothing for no items"""
+    ret = Iter([]).aggregate(count=count(), low=min_of(), avg=mean(), median=quantile(0.5))
+    assert ret == {"count": 0, "low": Nothing(), "avg": Nothing(), "median": Nothing()}
+
+
+def test_merge_chunks():
+    """Test states of chunks are merged into the same results"""
+    aggs = Aggregates(count=count(), avg=mean(), var=variance(), high=max_of(), signs=histogram(lambda x: x > 10))
+    states = [aggs.update(aggs.init(), DATA[idx : idx + 1000]) for idx in range(0, len(DATA), 1000)]
+    merged = aggs.finish(aggs.merge(*states))
+    whole = aggs.run(DATA)
+    assert merged["count"] == whole["count"]
+    assert merged["avg"].unwrap() == pytest.approx(whole["avg"].unwrap())
+    assert merged["var"].unwrap() == pytest.approx(whole["var"].unwrap())
+    assert merged["high"] == whole["high"]
+    assert merged["signs"] == whole["signs"]
+
+
+def test_distinct():
+    """Test HyperLogLog estimate stays within a few percent"""
+    aggs = Aggregates(distinct=distinct())
+    states = [aggs.update(aggs.init(), range(start, start + 30_000)) for start in (0, 20_000)]
+    assert aggs.finish(aggs.merge(*states))["distinct"] == pytest.approx(50_000, rel=0.05)
+    assert aggs.run(["a", "b", "a"])["distinct"] == 2
+
+
+def test_quantile():
+    """Test quantile sketch estimate stays close to the exact median"""
+    ret = Iter(DATA).aggregate(median=quantile(0.5))
+    assert ret["median"].unwrap() == pytest.approx(statistics.median(DATA), rel=0.05)
+
+
+def test_folding_states_do_not_share_first():
+    """Test each state of folding gets its own copy of a mutable first"""
+    aggs = Aggregates(items=folding(lambda acc, item: [*acc, item], [], add))
+    states = [aggs.update(aggs.init(), chunk) for chunk in ([1, 2], [3])]
+    assert aggs.finish(aggs.merge(*states)) == {"items": [1, 2, 3]}
+    assert aggs.run([9]) == {"items": [9]}
+
+    appending = Aggregates(items=folding(lambda acc, item: acc.append(item) or acc, [], lambda a, b: a + b))
+    states = [appending.update(appending.init(), chunk) for chunk in ([1, 2], [3])]
+    assert appending.finish(appending.merge(*states)) == {"items": [1, 2, 3]}
+    assert appending.run([9]) == {"items": [9]}
+
+
+def test_distinct_hashes_equal_numbers_equally():
+    """Test equal numbers are counted once and values of different types are not"""
+    aggs = Aggregates(distinct=distinct())
+    assert aggs.run([1, 1.0, True, complex(1, 0)])["distinct"] == 1
+    assert aggs.run([1, "1", b"1", (1,)])["distinct"] == 4
+
+
+def test_quantile_is_deterministic():
+    """Test quantile sketch gives the same result on every run"""
+    medians = {Iter(range(10_000)).aggregate(median=quantile(0.5))["median"].unwrap() for _ in range(5)}
+    assert len(medians) == 1
+    assert medians.pop() == pytest.approx(5000, rel=0.02)
+
+
+@pytest.mark.parametrize("capacity", (-1, 0, 1))
+def test_quantile_rejects_bad_capacity(capacity):
+    """Test quantile sketch requires at least two items per level"""
+    with pytest.raises(ValueError, match="capacity"):
+        quantile(0.5, capacity=capacity)
+
+
+@pytest.mark.parametrize("capacity", (2, 3, 4, 5, 7))
+def test_quantile_preserves_weight(capacity):
+    """Test compactions of odd and even levels keep the total weight of the sketch"""
+    aggs = Aggregates(median=quantile(0.5, capacity=capacity))
+    states = [aggs.update(aggs.init(), DATA[idx : idx + 999]) for idx in range(0, len(DATA), 999)]
+    for state in (aggs.update(aggs.init(), DATA), aggs.merge(*states)):
+        levels, _ = state["median"]
+        assert sum(len(items) << height for height, items in enumerate(levels)) == len(DATA)
+    assert aggs.run([1, 2])["median"] in (Some(1), Some(2))
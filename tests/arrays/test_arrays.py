@@ -0,0 +1,83 @@
+""""""
+
+from array import array
+
+import pytest
+
+from pyfplib import Err, Nothing, Ok, OptionArray, ResultArray, Some
+
+
+def test_option_array():
+    """Test OptionArray operations over columns"""
+    options = OptionArray.from_optional([1.5, None, 2.5] * 3, typecode="d")
+    assert len(options) == 9
+    assert options.count_some() == 6
+    assert options[1] == Nothing()
+    assert options[-1] == Some(2.5)
+    assert options.filter_some() == array("d", [1.5, 2.5] * 3)
+    assert options.unwrap_or(0.0) == array("d", [1.5, 0.0, 2.5] * 3)
+    assert options.fill(0.0).count_some() == 9
+    assert list(options.map(lambda x: x * 2)) == [Some(3.0), Nothing(), Some(5.0)] * 3
+    assert options.iter().len() == 9
+    assert OptionArray.from_options(options) == options
+
+
+def test_option_array_map_to_none():
+    """Test None returned by map makes a slot empty"""
+    options = OptionArray.from_options([Some(1), Some(2), Nothing()])
+    assert list(options.map(lambda x: None if x == 1 else x)) == [Nothing(), Some(2), Nothing()]
+
+
+def test_result_array():
+    """Test ResultArray operations over columns"""
+    results = ResultArray.from_results([Ok(1), Err("bad"), Ok(3)])
+    assert results.count_ok() == 2
+    assert results.count_err() == 1
+    assert results[1].unwrap_err() == "bad"
+    assert results.map(lambda x: x + 1).filter_ok() == [2, 4]
+    assert results.map_err(str.upper).filter_err() == ["BAD"]
+    assert results.unwrap_or(0) == [1, 0, 3]
+    assert results.ok().count_some() == 2
+    assert results.err().count_some() == 1
+    assert [result.is_ok() for result in results] == [True, False, True]
+
+
+def test_result_array_fill_and_eq():
+    """Test fill turns Errs into Ok and arrays compare by elements"""
+    data = [Ok(1), Err("bad"), Ok(3)]
+    results = ResultArray.from_results(data)
+    assert results == ResultArray.from_results(data)
+    assert results != ResultArray.from_results([Ok(1), Err("other"), Ok(3)])
+    assert results.fill(0) == ResultArray.from_results([Ok(1), Ok(0), Ok(3)])
+    assert results.fill(0).count_ok() == 3
+
+
+def test_derived_arrays_do_not_share_columns():
+    """Test arrays returned by map, map_err and ok are independent of the source"""
+    results = ResultArray.from_results([Ok(1), Err("bad")])
+    for derived in (results.map(str), results.map_err(str.upper), results.ok()):
+        derived.validity[0] = 0
+    results.map(str).errors[1] = "changed"
+    assert results[0].unwrap() == 1
+    assert results[1].unwrap_err() == "bad"
+    assert results.count_ok() == 1
+
+
+def test_map_keeps_typecode():
+    """Test map keeps a typed column unless typecode is given"""
+    options = OptionArray.from_optional([1, None, 3], typecode="q")
+    assert options.map(lambda x: x * 2).values == array("q", [2, 0, 6])
+    assert options.map(str, typecode=None).values == ["1", None, "3"]
+    results = ResultArray.from_results([Ok(1.5), Err("bad")], typecode="d")
+    assert results.typecode == "d"
+    assert results.map(lambda x: x * 2).values == array("d", [3.0, 0.0])
+    assert results.map(str, typecode=None).filter_ok() == ["1.5"]
+
+
+def test_typed_result_array_rejects_ok_none():
+    """Test Ok(None) is rejected by a typed column and kept by a list column"""
+    with pytest.raises(ValueError, match="Ok\\(None\\)"):
+        ResultArray.from_results([Ok(None), Err("bad")], typecode="q")
+    with pytest.raises(ValueError, match="Ok\\(None\\)"):
+        ResultArray.from_results([Ok(1)], typecode="q").map(lambda _: None)
+    assert ResultArray.from_results([Ok(None), Err("bad")])[0].is_ok()
@@ -0,0 +1,48 @@
+""""""
+
+import pytest
+
+from pyfplib import Iter
+
+
+@pytest.mark.parametrize(
+    "build, ex",
+    (
+        (lambda: Iter([1, 2, 3, 4, 5]), (5, 5)),
+        (lambda: Iter([1, 2, 3, 4, 5]).skip(2), (3, 3)),
+        (lambda: Iter([1, 2, 3, 4, 5]).skip(10), (0, 0)),
+        (lambda: Iter([1, 2, 3, 4, 5]).skip(-2), (2, 2)),
+        (lambda: Iter([1, 2, 3, 4, 5]).step_by(2), (3, 3)),
+        (lambda: Iter([1, 2, 3, 4, 5]).zip("ab"), (2, 2)),
+        (lambda: Iter([1, 2, 3, 4, 5]).zip(iter("ab")), (0, 5)),
+        (lambda: Iter([1, 2, 3, 4, 5]).filter(lambda x: x % 2), (0, 5)),
+        (lambda: Iter([1, 2, 3, 4, 5]).sort().reverse(), (5, 5)),
+    ),
+)
+def test_size_hint(build, ex):
+    """Test size_hint propagation through pipeline stages"""
+    itr = build()
+    assert itr.size_hint() == ex
+    assert ex[0] <= len(list(build())) <= ex[1]
+
+
+def test_len_applies_pipeline_when_inexact():
+    """Test len is correct both for exact and inexact size hints"""
+    assert len(Iter([1, 2, 3, 4, 5]).skip(1).step_by(2)) == 2
+    itr = Iter([1, 2, 3, 4, 5]).filter(lambda x: x % 2)
+    assert len(itr) == 3
+    assert itr.size_hint() == (3, 3)
+
+
+def test_len_follows_source_changes():
+    """Test len and size_hint reflect changes of the source made before the pipeline runs"""
+    items = []
+    itr = Iter(items)
+    items.append(1)
+    assert len(itr) == 1
+    assert list(itr) == [1]
+    items = [1, 2, 3]
+    itr = Iter(items).skip(1)
+    items.append(4)
+    assert itr.size_hint() == (3, 3)
+    assert len(itr) == 3
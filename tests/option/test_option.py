@@ -25,3 +25,10 @@ def test_some_must_be_some():
     #        assert True
     #    case Nothing():
     #        pytest.fail()
+
+
+def test_chain():
+    """Test chain stops at the first Nothing"""
+    assert Some(0).chain(*([lambda x: Some(x + 1)] * 10_000)) == Some(10_000)
+    assert Some(1).chain(lambda _: Nothing(), Some).is_none()
+    assert Nothing().chain(Some).is_none()
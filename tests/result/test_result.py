@@ -1,6 +1,6 @@
 import pytest
 
-from pyfplib import Ok, Result
+from pyfplib import Err, Ok, Result
 
 
 def create_result() -> Result:
@@ -16,3 +16,26 @@ def test_result():
     #       assert result.unwrap() == value
     #    case Err(Exception("TEST")):
     #        pytest.fail()
+
+
+def test_flatten_deeply_nested():
+    """Test flatten does not hit the recursion limit"""
+    result = Ok(1)
+    for _ in range(10_000):
+        result = Ok(result)
+    assert result.flatten().unwrap() == 1
+
+
+def test_chain():
+    """Test chain stops at the first Err"""
+    assert Ok(0).chain(*([lambda x: Ok(x + 1)] * 10_000)).unwrap() == 10_000
+    calls = []
+    result = Ok(1).chain(Err, lambda x: calls.append(x) or Ok(x))
+    assert result.unwrap_err() == 1
+    assert calls == []
+
+
+def test_chain_calls_any_callable():
+    """Test chain calls classes and bound methods, unlike and_then"""
+    assert Ok(1).chain(Err).unwrap_err() == 1
+    assert Ok(1).and_then(Err).unwrap() == 1